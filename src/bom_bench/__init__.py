@@ -1,18 +1,40 @@
 """bom-bench: Generate and lock multiple package manager projects from test scenarios."""
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 import pluggy
 
 from bom_bench.config import __version__
-from bom_bench.generators.sbom.cyclonedx import (
-    generate_cyclonedx_sbom,
-    generate_meta_file,
-    generate_sbom_file,
-)
 from bom_bench.logging import get_logger
 
+if TYPE_CHECKING:
+    from bom_bench.generators.sbom.cyclonedx import (
+        generate_cyclonedx_sbom,
+        generate_meta_file,
+        generate_sbom_file,
+    )
+
 # Convenience export for plugins: from bom_bench import hookimpl
 hookimpl = pluggy.HookimplMarker("bom_bench")
 
+# The CycloneDX library dominates import time, so its helpers load on first use
+_LAZY_EXPORTS = {
+    "generate_cyclonedx_sbom": "bom_bench.generators.sbom.cyclonedx",
+    "generate_sbom_file": "bom_bench.generators.sbom.cyclonedx",
+    "generate_meta_file": "bom_bench.generators.sbom.cyclonedx",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(_LAZY_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
+
+
 __all__ = [
     "__version__",
     "hookimpl",
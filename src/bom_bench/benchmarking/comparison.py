@@ -76,7 +76,7 @@ def extract_purls_from_cyclonedx(sbom: dict[str, Any]) -> set[str]:
                 if normalized != ROOT_PROJECT_PURL:
                     purls.add(normalized)
             except Exception as e:
-                logger.debug(f"Skipping invalid PURL '{purl}': {e}")
+                logger.debug("Skipping invalid PURL '%s': %s", purl, e)
 
     return purls
 
@@ -106,15 +106,15 @@ def load_scenario_meta(path: Path) -> dict[str, Any] | None:
             return data
 
     except FileNotFoundError:
-        logger.debug(f"Meta file not found: {path}")
+        logger.debug("Meta file not found: %s", path)
         return None
 
     except json.JSONDecodeError as e:
-        logger.warning(f"Invalid JSON in meta file {path}: {e}")
+        logger.warning("Invalid JSON in meta file %s: %s", path, e)
         return None
 
     except Exception as e:
-        logger.warning(f"Error loading meta file {path}: {e}")
+        logger.warning("Error loading meta file %s: %s", path, e)
         return None
 
 
@@ -154,15 +154,15 @@ def load_expected_sbom(
             return sbom, True
 
         except FileNotFoundError:
-            logger.debug(f"Expected SBOM not found: {path}")
+            logger.debug("Expected SBOM not found: %s", path)
             return None, True
 
         except json.JSONDecodeError as e:
-            logger.warning(f"Invalid JSON in expected SBOM {path}: {e}")
+            logger.warning("Invalid JSON in expected SBOM %s: %s", path, e)
             return None, True
 
         except Exception as e:
-            logger.warning(f"Error loading expected SBOM {path}: {e}")
+            logger.warning("Error loading expected SBOM %s: %s", path, e)
             return None, True
 
     # Legacy format: wrapper with satisfiable and sbom fields
@@ -174,20 +174,20 @@ def load_expected_sbom(
         sbom = data.get("sbom")
 
         if not sbom and satisfiable:
-            logger.warning(f"Expected SBOM at {path} has no 'sbom' field")
+            logger.warning("Expected SBOM at %s has no 'sbom' field", path)
 
         return sbom, satisfiable
 
     except FileNotFoundError:
-        logger.debug(f"Expected SBOM not found: {path}")
+        logger.debug("Expected SBOM not found: %s", path)
         return None, True
 
     except json.JSONDecodeError as e:
-        logger.warning(f"Invalid JSON in expected SBOM {path}: {e}")
+        logger.warning("Invalid JSON in expected SBOM %s: %s", path, e)
         return None, True
 
     except Exception as e:
-        logger.warning(f"Error loading expected SBOM {path}: {e}")
+        logger.warning("Error loading expected SBOM %s: %s", path, e)
         return None, True
 
 
@@ -208,15 +208,15 @@ def load_actual_sbom(path: Path) -> dict[str, Any] | None:
             return data
 
     except FileNotFoundError:
-        logger.debug(f"Actual SBOM not found: {path}")
+        logger.debug("Actual SBOM not found: %s", path)
         return None
 
     except json.JSONDecodeError as e:
-        logger.warning(f"Invalid JSON in actual SBOM {path}: {e}")
+        logger.warning("Invalid JSON in actual SBOM %s: %s", path, e)
         return None
 
     except Exception as e:
-        logger.warning(f"Error loading actual SBOM {path}: {e}")
+        logger.warning("Error loading actual SBOM %s: %s", path, e)
         return None
 
 
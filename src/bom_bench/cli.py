@@ -1,5 +1,7 @@
 """Command-line interface for bom-bench."""
 
+import sys
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Annotated
 
@@ -64,17 +66,17 @@ def _invalidate_fixture_caches(data_dir: Path) -> None:
 
     manifests = list(fixture_cache_dir.glob("**/.cache_manifest.json"))
     for cache_manifest in manifests:
-        logger.info(f"Deleting cache manifest: {cache_manifest}")
+        logger.info("Deleting cache manifest: %s", cache_manifest)
         cache_manifest.unlink()
 
     if manifests:
-        logger.info(f"Invalidated {len(manifests)} fixture cache(s)")
+        logger.info("Invalidated %d fixture cache(s)", len(manifests))
     else:
         logger.info("No fixture caches found to invalidate")
 
 
 def _validate_tool_selection(
-    requested_tools: list[str] | None, registered_tools: dict
+    requested_tools: list[str] | None, registered_tools: Mapping
 ) -> list[str]:
     """Validate requested tools exist and return final tool list."""
     if not requested_tools:
@@ -86,7 +88,7 @@ def _validate_tool_selection(
             error(f"Unknown SCA tool: {tool}. Available: {available}")
             raise typer.Exit(1)
 
-    return requested_tools
+    return [sys.intern(tool) for tool in requested_tools]
 
 
 def _filter_fixtures(fixture_sets: list, fixture_name_list: list[str] | None) -> list:
@@ -144,6 +146,10 @@ def benchmark(
         bool,
         typer.Option("--refresh-fixtures", help="Invalidate fixture cache and regenerate"),
     ] = False,
+    jobs: Annotated[
+        int,
+        typer.Option("-j", "--jobs", min=1, help="Number of fixtures to run concurrently"),
+    ] = 1,
     verbose: Annotated[
         bool,
         typer.Option("-v", "--verbose", help="Enable verbose output (DEBUG level)"),
@@ -182,12 +188,12 @@ def benchmark(
     fixture_set_list = _parse_comma_list(fixture_sets)
     fixture_name_list = _parse_comma_list(fixture_names)
 
-    logger.info(f"SCA Tools: {', '.join(tool_list)}")
+    logger.info("SCA Tools: %s", ", ".join(tool_list))
     if fixture_set_list:
-        logger.info(f"Fixture Sets: {', '.join(fixture_set_list)}")
+        logger.info("Fixture Sets: %s", ", ".join(fixture_set_list))
     if fixture_name_list:
-        logger.info(f"Fixtures: {', '.join(fixture_name_list)}")
-    logger.info(f"Output dir: {output_dir}")
+        logger.info("Fixtures: %s", ", ".join(fixture_name_list))
+    logger.info("Output dir: %s", output_dir)
 
     loader = FixtureSetLoader()
     all_fixture_sets = loader.load_all()
@@ -206,7 +212,7 @@ def benchmark(
     layout, progress, progress_task, status_progress, status_task = _create_progress_display()
     progress.update(progress_task, total=total_tasks)
 
-    runner = BenchmarkRunner(output_dir=output_dir)
+    runner = BenchmarkRunner(output_dir=output_dir, max_workers=jobs)
 
     def progress_callback(tool_name: str, fixture_set_name: str, fixture_name: str, result):
         """Update progress display after each fixture execution."""
@@ -159,7 +159,7 @@ def _generate_fixture(
             satisfiable = exit_code == 0
         except subprocess.TimeoutExpired:
             stderr = f"Timeout after {timeout} seconds"
-            logger.warning(f"Timeout generating fixture: {name}")
+            logger.warning("Timeout generating fixture: %s", name)
         except FileNotFoundError:
             stderr = "uv not found"
             logger.warning("uv not installed, cannot generate packse fixtures")
@@ -189,7 +189,7 @@ def _generate_fixture(
         }
 
     except Exception as e:
-        logger.error(f"Error generating fixture {name}: {e}")
+        logger.error("Error generating fixture %s: %s", name, e)
         return None
 
 
@@ -218,7 +218,7 @@ def _generate_fixtures(
 
     # Fetch packse data if needed
     if not data_dir.exists():
-        logger.info(f"Fetching packse scenarios to {data_dir}")
+        logger.info("Fetching packse scenarios to %s", data_dir)
         packse.fetch.fetch(dest=data_dir)
 
     # Check cache
@@ -251,11 +251,11 @@ def _generate_fixtures(
         fixture = _generate_fixture(scenario, cache_dir, bom_bench)
         if fixture:
             fixtures.append(fixture)
-            logger.debug(f"Generated fixture: {fixture['name']}")
+            logger.debug("Generated fixture: %s", fixture["name"])
 
     # Save cache manifest
     _save_cache_manifest(cache_dir, source_hash)
-    logger.info(f"Generated {len(fixtures)} packse fixtures")
+    logger.info("Generated %d packse fixtures", len(fixtures))
 
     return fixtures
 
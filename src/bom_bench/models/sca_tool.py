@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import statistics
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -21,7 +22,7 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class SCAToolInfo:
     """Metadata about an SCA tool provided by a plugin.
 
@@ -152,7 +153,7 @@ class BenchmarkStatus(Enum):
     """expected.cdx.json not found"""
 
 
-@dataclass
+@dataclass(slots=True)
 class PurlMetrics:
     """Metrics from PURL comparison."""
 
@@ -174,14 +175,16 @@ class PurlMetrics:
     f1_score: float = 0.0
     """Harmonic mean of precision and recall"""
 
-    expected_purls: set[str] = field(default_factory=set)
+    expected_purls: AbstractSet[str] = field(default_factory=set)
     """Set of expected PURLs"""
 
-    actual_purls: set[str] = field(default_factory=set)
+    actual_purls: AbstractSet[str] = field(default_factory=set)
     """Set of actual PURLs"""
 
     @classmethod
-    def calculate(cls, expected_purls: set[str], actual_purls: set[str]) -> PurlMetrics:
+    def calculate(
+        cls, expected_purls: AbstractSet[str], actual_purls: AbstractSet[str]
+    ) -> PurlMetrics:
         """Calculate metrics from two sets of purls.
 
         Args:
@@ -233,7 +236,7 @@ class PurlMetrics:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class BenchmarkResult:
     """Result of benchmarking a single scenario."""
 
@@ -367,22 +370,22 @@ class BenchmarkSummary:
 
     def calculate_aggregates(self) -> None:
         """Calculate mean and median metrics from successful runs."""
-        successful_metrics = [
-            r.metrics
-            for r in self.results
-            if r.status == BenchmarkStatus.SUCCESS and r.metrics is not None
-        ]
-
-        if not successful_metrics:
+        # Collect all three metrics in one pass over the results
+        precisions: list[float] = []
+        recalls: list[float] = []
+        f1_scores: list[float] = []
+        for r in self.results:
+            if r.status == BenchmarkStatus.SUCCESS and r.metrics is not None:
+                precisions.append(r.metrics.precision)
+                recalls.append(r.metrics.recall)
+                f1_scores.append(r.metrics.f1_score)
+
+        if not precisions:
             return
 
-        precisions = [m.precision for m in successful_metrics]
-        recalls = [m.recall for m in successful_metrics]
-        f1_scores = [m.f1_score for m in successful_metrics]
-
-        self.mean_precision = statistics.mean(precisions)
-        self.mean_recall = statistics.mean(recalls)
-        self.mean_f1_score = statistics.mean(f1_scores)
+        self.mean_precision = statistics.fmean(precisions)
+        self.mean_recall = statistics.fmean(recalls)
+        self.mean_f1_score = statistics.fmean(f1_scores)
 
         self.median_precision = statistics.median(precisions)
         self.median_recall = statistics.median(recalls)
@@ -509,15 +512,19 @@ class BenchmarkOverallSummary:
         overall.total_scenarios = sum(s.total_scenarios for s in summaries)
         overall.successful = sum(s.successful for s in summaries)
 
-        successful_summaries = [s for s in summaries if s.successful > 0]
-        if successful_summaries:
-            precisions = [s.mean_precision for s in successful_summaries]
-            recalls = [s.mean_recall for s in successful_summaries]
-            f1_scores = [s.mean_f1_score for s in successful_summaries]
-
-            overall.mean_precision = statistics.mean(precisions)
-            overall.mean_recall = statistics.mean(recalls)
-            overall.mean_f1_score = statistics.mean(f1_scores)
+        precisions: list[float] = []
+        recalls: list[float] = []
+        f1_scores: list[float] = []
+        for s in summaries:
+            if s.successful > 0:
+                precisions.append(s.mean_precision)
+                recalls.append(s.mean_recall)
+                f1_scores.append(s.mean_f1_score)
+
+        if precisions:
+            overall.mean_precision = statistics.fmean(precisions)
+            overall.mean_recall = statistics.fmean(recalls)
+            overall.mean_f1_score = statistics.fmean(f1_scores)
 
             overall.median_precision = statistics.median(precisions)
             overall.median_recall = statistics.median(recalls)
@@ -14,8 +14,9 @@ For SCA tools, import from bom_bench.sca_tools:
     )
 """
 
-import contextlib
 import importlib
+import threading
+from dataclasses import dataclass
 
 import pluggy
 
@@ -25,6 +26,17 @@ from bom_bench.plugins.hookspecs import FixtureSetSpec, RendererSpec, SCAToolSpe
 logger = get_logger(__name__)
 
 
+@dataclass(frozen=True, slots=True)
+class PluginInfo:
+    """Name and module of a loaded plugin."""
+
+    name: str
+    """Name the plugin is registered under"""
+
+    module: str
+    """Module name of the plugin"""
+
+
 # Default plugins bundled with bom-bench
 # These are loaded automatically on initialization
 DEFAULT_PLUGINS = (
@@ -51,6 +63,13 @@ pm.add_hookspecs(RendererSpec)
 
 # Track initialization state
 _initialized: bool = False
+_init_lock = threading.Lock()
+
+# Plugins registered by initialize_plugins(), in registration order
+_loaded_plugins: list[object] = []
+
+# Plugin info snapshot built once per initialization for get_plugins()
+_plugin_info: list[PluginInfo] = []
 
 
 def _load_default_plugins() -> None:
@@ -59,9 +78,10 @@ def _load_default_plugins() -> None:
         try:
             module = importlib.import_module(plugin_path)
             pm.register(module, name=plugin_path)
-            logger.debug(f"Loaded plugin: {plugin_path}")
+            _loaded_plugins.append(module)
+            logger.debug("Loaded plugin: %s", plugin_path)
         except ImportError as e:
-            logger.debug(f"Could not load plugin {plugin_path}: {e}")
+            logger.debug("Could not load plugin %s: %s", plugin_path, e)
 
 
 def _load_external_plugins() -> None:
@@ -69,9 +89,10 @@ def _load_external_plugins() -> None:
     try:
         num_loaded = pm.load_setuptools_entrypoints("bom_bench")
         if num_loaded > 0:
-            logger.debug(f"Loaded {num_loaded} external plugin(s)")
+            _loaded_plugins.extend(plugin for plugin, _ in pm.list_plugin_distinfo()[-num_loaded:])
+            logger.debug("Loaded %d external plugin(s)", num_loaded)
     except Exception as e:
-        logger.warning(f"Error loading external plugins: {e}")
+        logger.warning("Error loading external plugins: %s", e)
 
 
 def initialize_plugins() -> None:
@@ -80,78 +101,81 @@ def initialize_plugins() -> None:
     Loads bundled plugins first, then discovers external plugins
     via entry points. Collects tool registrations from all plugins.
 
-    This function is idempotent - calling it multiple times has no effect
-    after the first call.
+    This function is idempotent and thread-safe - calling it multiple times
+    has no effect after the first call.
     """
     global _initialized
 
     if _initialized:
         return
 
-    # Load default plugins
-    _load_default_plugins()
+    with _init_lock:
+        if _initialized:
+            return
+
+        # Load default plugins
+        _load_default_plugins()
+
+        # Load external plugins via entry points
+        _load_external_plugins()
 
-    # Load external plugins via entry points
-    _load_external_plugins()
+        # Register via domain modules
+        from bom_bench.sca_tools import _register_tools
 
-    # Register via domain modules
-    from bom_bench.sca_tools import _register_tools
+        _register_tools(pm)
 
-    _register_tools(pm)
+        _plugin_info[:] = [
+            PluginInfo(name=pm.get_name(plugin), module=getattr(plugin, "__name__", str(plugin)))
+            for plugin in pm.get_plugins()
+        ]
 
-    _initialized = True
+        _initialized = True
 
     # Get counts for logging
     from bom_bench.sca_tools import _registered_tools
 
-    logger.debug(f"Plugin system initialized with {len(_registered_tools)} tool(s)")
+    logger.debug("Plugin system initialized with %d tool(s)", len(_registered_tools))
 
 
 def reset_plugins() -> None:
     """Reset the plugin system (mainly for testing).
 
-    Clears all registered tools, unregisters all plugins, and marks
-    the system as uninitialized. The next call to initialize_plugins()
-    will re-initialize the system.
+    Clears all registered tools, unregisters the plugins loaded by
+    initialize_plugins(), and marks the system as uninitialized. The next
+    call to initialize_plugins() will re-initialize the system.
     """
     global _initialized
 
-    # Unregister all plugins from the plugin manager
-    for plugin in list(pm.get_plugins()):
-        with contextlib.suppress(Exception):
-            pm.unregister(plugin)
+    with _init_lock:
+        # Unregister in reverse so hook order is unwound the way it was built
+        while _loaded_plugins:
+            plugin = _loaded_plugins.pop()
+            if pm.is_registered(plugin):
+                pm.unregister(plugin)
 
-    # Reset domain module registries
-    from bom_bench.sca_tools import _reset_tools
+        # Reset domain module registries
+        from bom_bench.sca_tools import _reset_tools
 
-    _reset_tools()
+        _reset_tools()
+        _plugin_info.clear()
 
-    _initialized = False
+        _initialized = False
 
 
-def get_plugins() -> list[dict]:
+def get_plugins() -> list[PluginInfo]:
     """Get information about loaded plugins.
 
     Returns:
-        List of plugin info dictionaries with name, module, and hooks.
+        List of PluginInfo with the name and module of each plugin.
     """
-    if not _initialized:
-        initialize_plugins()
-
-    plugins = []
-    for plugin in pm.get_plugins():
-        plugin_info = {
-            "name": pm.get_name(plugin),
-            "module": getattr(plugin, "__name__", str(plugin)),
-        }
-        plugins.append(plugin_info)
-
-    return plugins
+    initialize_plugins()
+    return list(_plugin_info)
 
 
 __all__ = [
     "pm",
     "DEFAULT_PLUGINS",
+    "PluginInfo",
     "initialize_plugins",
     "reset_plugins",
     "get_plugins",
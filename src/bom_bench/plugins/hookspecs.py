@@ -183,6 +183,9 @@ class RendererSpec:
     """Hook specifications for result renderer plugins.
 
     Plugins implement these hooks to generate output files from benchmark results.
+
+    The summary dicts passed to these hooks are shared by every renderer, at both
+    the tool and benchmark level, so implementations must treat them as read-only.
     """
 
     @hookspec
@@ -208,9 +211,11 @@ class RendererSpec:
                 - successful/sbom_failed/unsatisfiable: Status counts
                 - mean/median metrics: Precision, recall, F1
                 - results: List of BenchmarkResult dicts with metrics
+                Shared with all other renderers; do not mutate.
 
         Returns:
             Dict with 'filename' and 'content' keys, or None to skip rendering.
+            Content may be a str (written as UTF-8) or already-encoded bytes.
             The file will be written to output/benchmarks/{tool_name}/{filename}
 
         Example implementation:
@@ -249,9 +254,11 @@ class RendererSpec:
             summaries: List of all BenchmarkSummary dicts (all tools, all fixture sets)
                 Each contains detailed results with individual scenario metrics.
                 Use this for detailed renderers that need per-scenario data.
+                Shared with all other renderers; do not mutate.
 
         Returns:
             Dict with 'filename' and 'content' keys, or None to skip rendering.
+            Content may be a str (written as UTF-8) or already-encoded bytes.
             The file will be written to output/benchmarks/{filename}
 
         Example implementation:
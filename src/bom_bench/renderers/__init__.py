@@ -1,5 +1,6 @@
 """Result renderer orchestration."""
 
+from collections import defaultdict
 from pathlib import Path
 
 import bom_bench
@@ -20,28 +21,44 @@ def render_results(
         summaries: List of BenchmarkSummary instances
         output_dir: Base directory for output files
     """
-    by_tool: dict[str, list] = {}
+    render_tools = bool(pm.hook.register_sca_tool_result_renderer.get_hookimpls())
+    render_benchmark = bool(pm.hook.register_benchmark_result_renderer.get_hookimpls())
+    # Skip building summary dicts when no plugin implements either hook
+    if not render_tools and not render_benchmark:
+        return
+
+    # Convert each summary once; tool-level and benchmark-level renderers share the dicts
+    by_tool: defaultdict[str, list[BenchmarkSummary]] = defaultdict(list)
+    dicts_by_tool: defaultdict[str, list[dict]] = defaultdict(list)
+    all_summary_dicts = []
     for summary in summaries:
-        by_tool.setdefault(summary.tool_name, []).append(summary)
+        summary_dict = summary.to_dict()
+        all_summary_dicts.append(summary_dict)
+        by_tool[summary.tool_name].append(summary)
+        dicts_by_tool[summary.tool_name].append(summary_dict)
 
     # Render SCA tool-level results (per fixture set)
-    for tool_name, tool_summaries in by_tool.items():
-        tool_dir = output_dir / tool_name
-        tool_dir.mkdir(parents=True, exist_ok=True)
+    if render_tools:
+        for tool_name, tool_dicts in dicts_by_tool.items():
+            results = [
+                result
+                for result in pm.hook.register_sca_tool_result_renderer(
+                    bom_bench=bom_bench,
+                    tool_name=tool_name,
+                    summaries=tool_dicts,
+                )
+                if result
+            ]
+            if not results:
+                continue
 
-        tool_dicts = [s.to_dict() for s in tool_summaries]
-        for result in pm.hook.register_sca_tool_result_renderer(
-            bom_bench=bom_bench,
-            tool_name=tool_name,
-            summaries=tool_dicts,
-        ):
-            if result:
-                try:
-                    filepath = tool_dir / result["filename"]
-                    filepath.write_text(result["content"])
-                    logger.info(f"Wrote {filepath}")
-                except OSError as e:
-                    logger.error(f"Failed to write {filepath}: {e}")
+            tool_dir = output_dir / tool_name
+            tool_dir.mkdir(parents=True, exist_ok=True)
+            for result in results:
+                _write_result(tool_dir, result)
+
+    if not render_benchmark:
+        return
 
     # Compute overall summaries (aggregate across fixture sets per tool)
     overall_summaries = [
@@ -50,19 +67,37 @@ def render_results(
     ]
     overall_dicts = [s.to_dict() for s in overall_summaries]
 
-    # Convert all summaries to dicts for detailed renderers
-    all_summary_dicts = [s.to_dict() for s in summaries]
-
     # Render benchmark-level results (aggregated across all fixture sets)
-    for result in pm.hook.register_benchmark_result_renderer(
-        bom_bench=bom_bench,
-        overall_summaries=overall_dicts,
-        summaries=all_summary_dicts,
-    ):
-        if result:
-            try:
-                filepath = output_dir / result["filename"]
-                filepath.write_text(result["content"])
-                logger.info(f"Wrote {filepath}")
-            except OSError as e:
-                logger.error(f"Failed to write {filepath}: {e}")
+    results = [
+        result
+        for result in pm.hook.register_benchmark_result_renderer(
+            bom_bench=bom_bench,
+            overall_summaries=overall_dicts,
+            summaries=all_summary_dicts,
+        )
+        if result
+    ]
+    if not results:
+        return
+
+    output_dir.mkdir(parents=True, exist_ok=True)
+    for result in results:
+        _write_result(output_dir, result)
+
+
+def _write_result(directory: Path, result: dict) -> None:
+    """Write a renderer result into directory, logging rather than raising on failure.
+
+    Args:
+        directory: Existing directory to write into
+        result: Renderer result dict with 'filename' and 'content' (str or bytes) keys
+    """
+    filepath = directory / result["filename"]
+    content = result["content"]
+    if isinstance(content, str):
+        content = content.encode("utf-8")
+    try:
+        filepath.write_bytes(content)
+        logger.info("Wrote %s", filepath)
+    except OSError as e:
+        logger.error("Failed to write %s: %s", filepath, e)
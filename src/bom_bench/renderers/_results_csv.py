@@ -0,0 +1,83 @@
+"""Shared row formatting for the per-scenario results CSV renderers."""
+
+import csv
+import io
+from typing import Any
+
+CSV_HEADERS = [
+    "tool_name",
+    "fixture_set",
+    "scenario_name",
+    "status",
+    "true_positives",
+    "false_positives",
+    "false_negatives",
+    "precision",
+    "recall",
+    "f1_score",
+    "actual_purls",
+    "expected_purls",
+    "actual_sbom_path",
+    "expected_sbom_path",
+    "expected_satisfiable",
+    "error_message",
+]
+
+
+# Placeholder metric columns for results without metrics
+_EMPTY_METRICS = ("",) * 8
+
+
+def _format_metrics(metrics: dict | None) -> tuple[Any, ...]:
+    """Format metric values for CSV output, handling missing data gracefully.
+
+    Values are ordered to match the metric columns in CSV_HEADERS.
+    """
+    if not metrics:
+        return _EMPTY_METRICS
+
+    return (
+        metrics.get("true_positives"),
+        metrics.get("false_positives"),
+        metrics.get("false_negatives"),
+        f"{metrics.get('precision', 0):.4f}",
+        f"{metrics.get('recall', 0):.4f}",
+        f"{metrics.get('f1_score', 0):.4f}",
+        ";".join(metrics.get("actual_purls", [])),
+        ";".join(metrics.get("expected_purls", [])),
+    )
+
+
+def render_results_csv(summaries: list[dict]) -> str:
+    """Render one CSV row per scenario result across the given summaries.
+
+    Args:
+        summaries: List of BenchmarkSummary dicts.
+
+    Returns:
+        CSV content including the header row.
+    """
+    with io.StringIO() as output:
+        writer = csv.writer(output)
+        writer.writerow(CSV_HEADERS)
+
+        for summary in summaries:
+            tool_name = summary.get("tool_name")
+            fixture_set = summary.get("fixture_set")
+
+            for result in summary.get("results", []):
+                writer.writerow(
+                    (
+                        tool_name,
+                        fixture_set,
+                        result.get("scenario_name"),
+                        result.get("status"),
+                        *_format_metrics(result.get("metrics")),
+                        result.get("actual_sbom_path"),
+                        result.get("expected_sbom_path"),
+                        result.get("expected_satisfiable"),
+                        result.get("error_message"),
+                    )
+                )
+
+        return output.getvalue()
@@ -33,6 +33,12 @@ class FixtureExecutor:
         """
         self.config = config or SandboxConfig()
 
+        # Expected PURLs depend only on the fixture, so they are shared (frozen) across tools.
+        # Concurrent fixture runs may both fill an entry; they compute the same value.
+        self._expected_purls: dict[
+            tuple[Path, Path | None], tuple[frozenset[str] | None, bool]
+        ] = {}
+
     def execute(
         self,
         fixture: Fixture,
@@ -119,8 +125,8 @@ class FixtureExecutor:
                 actual_sbom_path=sandbox_result.actual_sbom_path,
             )
 
-        # Load expected SBOM
-        expected_sbom, satisfiable = load_expected_sbom(
+        # Load expected PURLs
+        expected_purls, satisfiable = self._load_expected_purls(
             fixture.files.expected_sbom,
             meta_path=fixture.files.meta,
         )
@@ -132,7 +138,7 @@ class FixtureExecutor:
                 expected_satisfiable=False,
             )
 
-        if expected_sbom is None:
+        if expected_purls is None:
             return replace(
                 base_result,
                 status=BenchmarkStatus.MISSING_EXPECTED,
@@ -140,7 +146,6 @@ class FixtureExecutor:
             )
 
         # Compare PURLs
-        expected_purls = extract_purls_from_cyclonedx(expected_sbom)
         actual_purls = extract_purls_from_cyclonedx(actual_sbom)
         metrics = PurlMetrics.calculate(expected_purls, actual_purls)
 
@@ -150,3 +155,31 @@ class FixtureExecutor:
             expected_sbom_path=fixture.files.expected_sbom,
             actual_sbom_path=sandbox_result.actual_sbom_path,
         )
+
+    def _load_expected_purls(
+        self, expected_sbom_path: Path, meta_path: Path | None
+    ) -> tuple[frozenset[str] | None, bool]:
+        """Load the expected PURLs for a fixture, parsing its expected SBOM only once.
+
+        Args:
+            expected_sbom_path: Path to the fixture's expected SBOM
+            meta_path: Path to the fixture's meta.json
+
+        Returns:
+            Tuple of (expected PURLs or None if loading failed, satisfiable boolean)
+        """
+        key = (expected_sbom_path, meta_path)
+        cached = self._expected_purls.get(key)
+        if cached is None:
+            expected_sbom, satisfiable = load_expected_sbom(
+                expected_sbom_path,
+                meta_path=meta_path,
+            )
+            expected_purls = (
+                frozenset(extract_purls_from_cyclonedx(expected_sbom))
+                if expected_sbom is not None
+                else None
+            )
+            cached = self._expected_purls[key] = (expected_purls, satisfiable)
+
+        return cached
@@ -4,6 +4,9 @@ Orchestrates running SCA tools against fixtures using sandboxes.
 """
 
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from functools import partial
 from pathlib import Path
 
 from bom_bench.console import console
@@ -34,15 +37,24 @@ class BenchmarkRunner:
         self,
         output_dir: Path,
         sandbox_config: SandboxConfig | None = None,
+        max_workers: int = 1,
     ):
         """Initialize benchmark runner.
 
         Args:
             output_dir: Directory for benchmark outputs
             sandbox_config: Configuration for sandbox execution
+            max_workers: Number of fixtures to execute concurrently (1 runs them serially)
+
+        Raises:
+            ValueError: If max_workers > 1 with a fixed sandbox temp_dir, since
+                concurrent fixtures would share and clean up the same directory
         """
         self.output_dir = output_dir
         self.sandbox_config = sandbox_config or SandboxConfig()
+        if max_workers > 1 and self.sandbox_config.temp_dir is not None:
+            raise ValueError("max_workers > 1 cannot be combined with a fixed sandbox temp_dir")
+        self.max_workers = max_workers
         self.loader = FixtureSetLoader()
         self.executor = FixtureExecutor(config=self.sandbox_config)
 
@@ -76,55 +88,65 @@ class BenchmarkRunner:
             logger.warning("No fixture sets found")
             return []
 
-        # Run benchmarks for each tool
-        for tool_name in tools:
-            tool_config = get_tool_config(tool_name)
-            if tool_config is None:
-                logger.warning(f"Tool '{tool_name}' not found or has no config")
-                continue
+        # Sandboxed runs mostly wait on tool subprocesses, so threads are enough
+        pool_context = (
+            ThreadPoolExecutor(max_workers=self.max_workers)
+            if self.max_workers > 1
+            else nullcontext()
+        )
+        with pool_context as pool:
+            map_fixtures = pool.map if pool is not None else map
+
+            # Run benchmarks for each tool
+            for tool_name in tools:
+                tool_config = get_tool_config(tool_name)
+                if tool_config is None:
+                    logger.warning("Tool '%s' not found or has no config", tool_name)
+                    continue
 
-            console.print()
-            console.print(f"[bold]=== Tool: {tool_name} ===[/bold]")
+                console.print()
+                console.print(f"[bold]=== Tool: {tool_name} ===[/bold]")
 
-            # Run for each fixture set
-            for fixture_set in all_fixture_sets:
-                logger.info(f"  Fixture Set: {fixture_set.name}")
+                # Run for each fixture set
+                for fixture_set in all_fixture_sets:
+                    logger.info("  Fixture Set: %s", fixture_set.name)
 
-                summary = BenchmarkSummary(
-                    package_manager=fixture_set.name,
-                    tool_name=tool_name,
-                )
+                    summary = BenchmarkSummary(
+                        package_manager=fixture_set.name,
+                        tool_name=tool_name,
+                    )
 
-                # Filter fixtures if specified
-                fixtures_to_run = fixture_set.fixtures
-                if fixtures:
-                    fixtures_to_run = [f for f in fixtures_to_run if f.name in fixtures]
+                    # Filter fixtures if specified
+                    fixtures_to_run = fixture_set.fixtures
+                    if fixtures:
+                        fixtures_to_run = [f for f in fixtures_to_run if f.name in fixtures]
 
-                if not fixtures_to_run:
-                    logger.warning(f"  No fixtures to run in {fixture_set.name}")
-                    continue
+                    if not fixtures_to_run:
+                        logger.warning("  No fixtures to run in %s", fixture_set.name)
+                        continue
 
-                # Execute each fixture
-                for fixture in fixtures_to_run:
-                    result = self.executor.execute(
-                        fixture=fixture,
+                    # Execute each fixture; map yields results in fixture order
+                    execute = partial(
+                        self.executor.execute,
                         fixture_set_env=fixture_set.environment,
                         tool_config=tool_config,
                         fixture_set_name=fixture_set.name,
                         output_dir=self.output_dir,
                     )
-                    summary.add_result(result)
-                    self._log_result(result)
+                    results = map_fixtures(execute, fixtures_to_run)
+                    for fixture, result in zip(fixtures_to_run, results, strict=True):
+                        summary.add_result(result)
+                        self._log_result(result)
 
-                    if progress_callback:
-                        progress_callback(tool_name, fixture_set.name, fixture.name, result)
+                        if progress_callback:
+                            progress_callback(tool_name, fixture_set.name, fixture.name, result)
 
-                # Calculate aggregates
-                summary.calculate_aggregates()
-                summaries.append(summary)
+                    # Calculate aggregates
+                    summary.calculate_aggregates()
+                    summaries.append(summary)
 
-                # Print summary
-                summary.print_summary()
+                    # Print summary
+                    summary.print_summary()
 
         # Render results to files
         render_results(summaries, self.output_dir)
@@ -135,16 +157,17 @@ class BenchmarkRunner:
         """Log a single benchmark result."""
         if result.status == BenchmarkStatus.SUCCESS and result.metrics:
             logger.info(
-                f"    {result.scenario_name}: "
-                f"P={result.metrics.precision:.3f} "
-                f"R={result.metrics.recall:.3f} "
-                f"F1={result.metrics.f1_score:.3f}"
+                "    %s: P=%.3f R=%.3f F1=%.3f",
+                result.scenario_name,
+                result.metrics.precision,
+                result.metrics.recall,
+                result.metrics.f1_score,
             )
         elif result.status == BenchmarkStatus.UNSATISFIABLE:
-            logger.info(f"    {result.scenario_name}: unsatisfiable (skipped)")
+            logger.info("    %s: unsatisfiable (skipped)", result.scenario_name)
         elif result.status == BenchmarkStatus.SBOM_GENERATION_FAILED:
-            logger.warning(f"    {result.scenario_name}: SBOM generation failed")
+            logger.warning("    %s: SBOM generation failed", result.scenario_name)
         elif result.status == BenchmarkStatus.MISSING_EXPECTED:
-            logger.warning(f"    {result.scenario_name}: missing expected SBOM")
+            logger.warning("    %s: missing expected SBOM", result.scenario_name)
         else:
-            logger.info(f"    {result.scenario_name}: {result.status.value}")
+            logger.info("    %s: %s", result.scenario_name, result.status.value)
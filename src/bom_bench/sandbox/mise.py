@@ -3,6 +3,7 @@ import shutil
 import subprocess
 import time
 from dataclasses import dataclass
+from functools import cache
 from pathlib import Path
 
 import tomlkit
@@ -27,6 +28,26 @@ class MiseRunResult:
     duration_seconds: float
     error_message: str | None = None
 
+    @classmethod
+    def failed(cls, error_message: str, duration_seconds: float = 0.0) -> "MiseRunResult":
+        """Create a result for a task that could not run to completion.
+
+        Args:
+            error_message: Why the task failed
+            duration_seconds: Time spent before the failure
+
+        Returns:
+            MiseRunResult with no exit code or output
+        """
+        return cls(
+            success=False,
+            exit_code=None,
+            stdout="",
+            stderr="",
+            duration_seconds=duration_seconds,
+            error_message=error_message,
+        )
+
 
 def generate_mise_toml(
     tools: list[ToolSpec],
@@ -48,30 +69,63 @@ def generate_mise_toml(
     if not tools and not env and not task_name:
         return ""
 
+    # Only the task command differs between fixtures run with the same tool and fixture set
+    content = _render_tools_and_env(
+        tuple((tool.name, tool.version) for tool in tools),
+        tuple(env.items()) if env else (),
+    )
+
+    if task_name and task_command:
+        doc = tomlkit.document()
+        tasks_table = tomlkit.table()
+        task_config = tomlkit.table()
+        task_config["run"] = task_command
+        tasks_table[task_name] = task_config
+        doc["tasks"] = tasks_table
+
+        if content:
+            content += "\n"
+        content += tomlkit.dumps(doc)
+
+    return content
+
+
+@cache
+def _render_tools_and_env(
+    tools: tuple[tuple[str, str], ...], env: tuple[tuple[str, str], ...]
+) -> str:
+    """Render the [tools] and [env] tables of a mise.toml.
+
+    Args:
+        tools: (name, version) pairs for mise-managed tools
+        env: (name, value) pairs for environment variables
+
+    Returns:
+        TOML string content, empty if there are no tools or env vars
+    """
     doc = tomlkit.document()
 
     if tools:
         tools_table = tomlkit.table()
-        for tool in tools:
-            tools_table[tool.name] = tool.version
+        for name, version in tools:
+            tools_table[name] = version
         doc["tools"] = tools_table
 
     if env:
         env_table = tomlkit.table()
-        for name, value in env.items():
+        for name, value in env:
             env_table[name] = value
         doc["env"] = env_table
 
-    if task_name and task_command:
-        tasks_table = tomlkit.table()
-        task_config = tomlkit.table()
-        task_config["run"] = task_command
-        tasks_table[task_name] = task_config
-        doc["tasks"] = tasks_table
-
     return tomlkit.dumps(doc)
 
 
+@cache
+def _find_mise() -> str | None:
+    """Locate the mise executable on PATH, probing only once per process."""
+    return shutil.which("mise")
+
+
 class MiseRunner:
     """Wrapper for running mise commands in a directory."""
 
@@ -82,10 +136,20 @@ class MiseRunner:
         """Get environment variables with MISE_CEILING_PATHS set for isolation.
 
         Sets MISE_CEILING_PATHS to the sandbox directory to prevent mise from
-        loading configuration files from parent directories.
+        loading configuration files from parent directories, and adds the
+        generated mise.toml (only) to MISE_TRUSTED_CONFIG_PATHS so no separate
+        `mise trust` run is needed. The trusted path is resolved because mise
+        compares it against the canonical config path (e.g. /var is a symlink
+        to /private/var on macOS).
         """
         env = os.environ.copy()
         env["MISE_CEILING_PATHS"] = str(self.cwd)
+
+        mise_toml = str((self.cwd / "mise.toml").resolve())
+        trusted = env.get("MISE_TRUSTED_CONFIG_PATHS")
+        env["MISE_TRUSTED_CONFIG_PATHS"] = (
+            f"{trusted}{os.pathsep}{mise_toml}" if trusted else mise_toml
+        )
         return env
 
     def run_task(self, task_name: str, timeout: int = 120) -> MiseRunResult:
@@ -98,83 +162,35 @@ class MiseRunner:
         Returns:
             MiseRunResult with execution details
         """
-        if not shutil.which("mise"):
-            return MiseRunResult(
-                success=False,
-                exit_code=None,
-                stdout="",
-                stderr="",
-                duration_seconds=0.0,
-                error_message="mise not found in PATH",
-            )
+        mise = _find_mise()
+        if not mise:
+            return MiseRunResult.failed("mise not found in PATH")
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             result = subprocess.run(
-                ["mise", "run", task_name],
+                [mise, "run", task_name],
                 cwd=self.cwd,
                 capture_output=True,
                 text=True,
                 timeout=timeout,
                 env=self._get_sandboxed_env(),
             )
-
-            duration = time.time() - start_time
-
+        except subprocess.TimeoutExpired:
+            error_message = f"Timeout after {timeout} seconds"
+        except Exception as e:
+            error_message = str(e)
+        else:
             return MiseRunResult(
                 success=result.returncode == 0,
                 exit_code=result.returncode,
                 stdout=result.stdout,
                 stderr=result.stderr,
-                duration_seconds=duration,
-            )
-
-        except subprocess.TimeoutExpired:
-            duration = time.time() - start_time
-            return MiseRunResult(
-                success=False,
-                exit_code=None,
-                stdout="",
-                stderr="",
-                duration_seconds=duration,
-                error_message=f"Timeout after {timeout} seconds",
-            )
-
-        except Exception as e:
-            duration = time.time() - start_time
-            return MiseRunResult(
-                success=False,
-                exit_code=None,
-                stdout="",
-                stderr="",
-                duration_seconds=duration,
-                error_message=str(e),
+                duration_seconds=time.perf_counter() - start_time,
             )
 
-    def trust(self) -> bool:
-        """Trust the mise.toml in the current directory.
-
-        Required before mise will execute tasks with untrusted configs.
-
-        Returns:
-            True if trust succeeded, False otherwise
-        """
-        if not shutil.which("mise"):
-            return False
-
-        try:
-            result = subprocess.run(
-                ["mise", "trust"],
-                cwd=self.cwd,
-                capture_output=True,
-                text=True,
-                timeout=10,
-                env=self._get_sandboxed_env(),
-            )
-            return result.returncode == 0
-        except Exception:
-            return False
+        return MiseRunResult.failed(error_message, time.perf_counter() - start_time)
 
     def write_mise_toml(
         self,
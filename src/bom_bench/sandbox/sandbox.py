@@ -96,8 +96,6 @@ class Sandbox:
             raise RuntimeError("Sandbox not initialized. Use as context manager.")
 
         runner = MiseRunner(cwd=self._sandbox_dir)
-        runner.trust()
-
         result = runner.run_task("sca", timeout=self.config.timeout)
 
         # Check if plugin has response handler hook
@@ -105,21 +103,23 @@ class Sandbox:
             self._handle_tool_response(result)
 
         # Copy SBOM to output directory if successful and output_dir is configured
+        output_path = self.output_path
+        sbom_created = result.success and output_path.exists()
         final_sbom_path: Path | None = None
-        if result.success and self.output_path.exists():
+        if sbom_created:
             if self.config.output_dir:
                 # Copy to persistent output directory before cleanup
                 final_sbom_path = self.config.output_dir / "actual.cdx.json"
                 final_sbom_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(self.output_path, final_sbom_path)
+                shutil.copy2(output_path, final_sbom_path)
             else:
                 # No output_dir configured, use sandbox path (may be deleted)
-                final_sbom_path = self.output_path
+                final_sbom_path = output_path
 
         return SandboxResult(
             fixture_name=self.fixture.name,
             tool_name=self.sca_tool.name,
-            success=result.success and self.output_path.exists(),
+            success=sbom_created,
             actual_sbom_path=final_sbom_path,
             duration_seconds=result.duration_seconds,
             exit_code=result.exit_code,
@@ -140,40 +140,39 @@ class Sandbox:
         """
         import bom_bench
         from bom_bench.logging import get_logger
-        from bom_bench.sca_tools import get_tool_plugin
+        from bom_bench.sca_tools import get_tool_response_handler
 
         logger = get_logger(__name__)
 
-        tool_plugin = get_tool_plugin(self.sca_tool.name)
-        if tool_plugin is None:
-            return
-
-        # Check if plugin implements the response handler hook
-        if not hasattr(tool_plugin, "handle_sca_tool_response"):
+        handler = get_tool_response_handler(self.sca_tool.name)
+        if handler is None:
             return
 
         try:
             # Read output file contents if it exists
-            output_file_contents = None
-            if self.output_path.exists():
+            try:
                 output_file_contents = self.output_path.read_text()
+            except FileNotFoundError:
+                output_file_contents = None
 
             # Call the hook directly on the plugin
-            parsed_sbom = tool_plugin.handle_sca_tool_response(  # type: ignore[attr-defined]
+            parsed_sbom = handler(
                 bom_bench=bom_bench,
                 stdout=mise_result.stdout,
                 stderr=mise_result.stderr,
                 output_file_contents=output_file_contents,
             )
 
-            # If hook returned a parsed SBOM, write it to output path
-            if parsed_sbom is not None:
+            # If hook returned a new SBOM, write it to output path
+            if parsed_sbom is not None and parsed_sbom != output_file_contents:
                 self.output_path.write_text(parsed_sbom)
 
         except Exception as e:
             # Log error but don't fail the entire benchmark
             logger.error(
-                f"Error in handle_sca_tool_response hook for {self.sca_tool.name}: {e}",
+                "Error in handle_sca_tool_response hook for %s: %s",
+                self.sca_tool.name,
+                e,
                 exc_info=True,
             )
 
@@ -207,11 +206,4 @@ class Sandbox:
         if self._sandbox_dir is None:
             return
 
-        self.project_dir.mkdir(parents=True, exist_ok=True)
-
-        src_dir = self.fixture.project_dir
-        for item in src_dir.iterdir():
-            if item.is_file():
-                shutil.copy2(item, self.project_dir / item.name)
-            elif item.is_dir():
-                shutil.copytree(item, self.project_dir / item.name)
+        shutil.copytree(self.fixture.project_dir, self.project_dir, dirs_exist_ok=True)
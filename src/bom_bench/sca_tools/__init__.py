@@ -12,8 +12,13 @@ Available plugins:
 - syft: Anchore Syft
 """
 
+import sys
+from collections.abc import Callable, Mapping
+from types import MappingProxyType
 from typing import Protocol, runtime_checkable
 
+from pluggy import HookImpl
+
 from bom_bench.logging import get_logger
 from bom_bench.models.sca_tool import SCAToolConfig, SCAToolInfo
 from bom_bench.utils import expandvars_dict
@@ -39,8 +44,10 @@ class SCAToolPlugin(Protocol):
 
 # Track registered tools
 _registered_tools: dict[str, SCAToolInfo] = {}
+_registered_tools_view: Mapping[str, SCAToolInfo] = MappingProxyType(_registered_tools)
 _registered_tool_data: dict[str, dict] = {}
 _registered_tool_plugins: dict[str, SCAToolPlugin] = {}  # tool_name -> plugin module
+_registered_tool_handlers: dict[str, Callable[..., str | None]] = {}  # tool_name -> response hook
 
 
 def _register_tools(pm) -> None:
@@ -52,9 +59,12 @@ def _register_tools(pm) -> None:
         pm: The pluggy PluginManager instance
     """
     global _registered_tools, _registered_tool_data, _registered_tool_plugins
+    global _registered_tool_handlers, _registered_tools_view
     _registered_tools = {}
+    _registered_tools_view = MappingProxyType(_registered_tools)
     _registered_tool_data = {}
     _registered_tool_plugins = {}
+    _registered_tool_handlers = {}
 
     # Get all tool data from plugins via pluggy hooks
     tool_data_list = pm.hook.register_sca_tools()
@@ -65,16 +75,39 @@ def _register_tools(pm) -> None:
     # Process each tool and track which plugin registered it
     # tool_data_list is in execution order (LIFO), hook_impls is in registration order (FIFO)
     # Reverse hook_impls to match the execution order
-    for tool_data, hook_impl in zip(tool_data_list, reversed(hook_impls), strict=True):
-        if tool_data:
-            # Only expand env vars in the 'env' dict, not in 'args' (which contains runtime placeholders)
-            if "env" in tool_data:
-                tool_data["env"] = expandvars_dict(tool_data["env"])
-            tool_info = SCAToolInfo.from_dict(tool_data)
-            _registered_tools[tool_info.name] = tool_info
-            _registered_tool_data[tool_info.name] = tool_data
-            _registered_tool_plugins[tool_info.name] = hook_impl.plugin  # Track plugin
-            logger.debug(f"Registered SCA tool: {tool_info.name}")
+    registrations = [
+        (tool_data, hook_impl)
+        for tool_data, hook_impl in zip(tool_data_list, reversed(hook_impls), strict=True)
+        if tool_data
+    ]
+
+    # The first plugin to claim a name (in registration order) wins
+    winners: dict[str, tuple[dict, HookImpl]] = {}
+    for tool_data, hook_impl in reversed(registrations):
+        if tool_data["name"] in winners:
+            logger.debug("Skipping duplicate SCA tool registration: %s", tool_data["name"])
+        else:
+            winners[tool_data["name"]] = (tool_data, hook_impl)
+
+    # Insert in execution order so the registry (and default tool run order) is unchanged
+    for name in (tool_data["name"] for tool_data, _ in registrations):
+        if name in _registered_tools:
+            continue
+        tool_data, hook_impl = winners[name]
+        # Only expand env vars in the 'env' dict, not in 'args' (which contains runtime placeholders)
+        if "env" in tool_data:
+            tool_data["env"] = expandvars_dict(tool_data["env"])
+        # Interned names let registry lookups short-circuit on identity
+        tool_data["name"] = sys.intern(tool_data["name"])
+        tool_info = SCAToolInfo.from_dict(tool_data)
+        _registered_tools[tool_info.name] = tool_info
+        _registered_tool_data[tool_info.name] = tool_data
+        _registered_tool_plugins[tool_info.name] = hook_impl.plugin  # Track plugin
+        # Resolve the response hook once so sandboxes can call it without pluggy dispatch
+        handler = getattr(hook_impl.plugin, "handle_sca_tool_response", None)
+        if handler is not None:
+            _registered_tool_handlers[tool_info.name] = handler
+        logger.debug("Registered SCA tool: %s", tool_info.name)
 
 
 def _reset_tools() -> None:
@@ -83,21 +116,24 @@ def _reset_tools() -> None:
     Called by reset_plugins() in bom_bench.plugins.
     """
     global _registered_tools, _registered_tool_data, _registered_tool_plugins
+    global _registered_tool_handlers, _registered_tools_view
     _registered_tools = {}
+    _registered_tools_view = MappingProxyType(_registered_tools)
     _registered_tool_data = {}
     _registered_tool_plugins = {}
+    _registered_tool_handlers = {}
 
 
-def get_registered_tools() -> dict[str, SCAToolInfo]:
+def get_registered_tools() -> Mapping[str, SCAToolInfo]:
     """Get all registered SCA tools.
 
     Returns:
-        Dictionary mapping tool name to SCAToolInfo.
+        Read-only mapping of tool name to SCAToolInfo.
     """
     from bom_bench.plugins import initialize_plugins
 
     initialize_plugins()
-    return _registered_tools.copy()
+    return _registered_tools_view
 
 
 def get_tool_info(tool_name: str) -> SCAToolInfo | None:
@@ -133,7 +169,7 @@ def get_tool_config(tool_name: str) -> SCAToolConfig | None:
 
     # Check if tool has declarative config
     if "command" not in tool_data:
-        logger.warning(f"Tool '{tool_name}' does not have declarative config")
+        logger.warning("Tool '%s' does not have declarative config", tool_name)
         return None
 
     return SCAToolConfig.from_dict(tool_data)
@@ -154,9 +190,29 @@ def get_tool_plugin(tool_name: str) -> SCAToolPlugin | None:
     return _registered_tool_plugins.get(tool_name)
 
 
+def get_tool_response_handler(tool_name: str) -> Callable[..., str | None] | None:
+    """Get the handle_sca_tool_response implementation for a specific tool.
+
+    The handler is resolved once at registration, so callers can invoke it
+    directly instead of looking up the plugin on every sandbox run.
+
+    Args:
+        tool_name: Name of the tool
+
+    Returns:
+        The plugin's handle_sca_tool_response callable, or None if the tool
+        is not registered or its plugin does not implement the hook
+    """
+    from bom_bench.plugins import initialize_plugins
+
+    initialize_plugins()
+    return _registered_tool_handlers.get(tool_name)
+
+
 __all__ = [
     "get_registered_tools",
     "get_tool_info",
     "get_tool_config",
     "get_tool_plugin",
+    "get_tool_response_handler",
 ]
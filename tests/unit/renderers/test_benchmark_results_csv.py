@@ -211,3 +211,20 @@ class TestBenchmarkResultsCSVRenderer:
         assert len(rows) == 0
         # But headers should still be present
         assert reader.fieldnames is not None
+
+    def test_matches_per_tool_results_csv(self):
+        """Test that the benchmark and per-tool results CSVs share one row format."""
+        from bom_bench.renderers.sca_tool_results_csv import register_sca_tool_result_renderer
+
+        summaries = [
+            {
+                "tool_name": "cdxgen",
+                "fixture_set": "packse",
+                "results": [{"scenario_name": "test1", "status": "success", "metrics": None}],
+            }
+        ]
+
+        benchmark = register_benchmark_result_renderer(summaries)
+        per_tool = register_sca_tool_result_renderer(tool_name="cdxgen", summaries=summaries)
+
+        assert benchmark["content"] == per_tool["content"]
@@ -41,3 +41,27 @@ def test_all_exports_in_dunder_all():
         "get_logger",
     }
     assert expected_exports.issubset(set(bom_bench.__all__))
+
+
+def test_cyclonedx_helpers_are_imported_lazily():
+    """Importing bom_bench should not load the CycloneDX library."""
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, bom_bench; "
+        "assert 'cyclonedx' not in sys.modules; "
+        "assert callable(bom_bench.generate_cyclonedx_sbom); "
+        "assert 'cyclonedx' in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_unknown_attribute_raises():
+    """Unknown attributes should still raise AttributeError."""
+    import pytest
+
+    import bom_bench
+
+    with pytest.raises(AttributeError):
+        _ = bom_bench.not_a_real_export
@@ -275,6 +275,33 @@ class TestBenchmark:
         mock_runner.run.assert_called_once()
         mock_summary.print_summary.assert_called_once()
 
+    @patch("bom_bench.plugins.initialize_plugins")
+    @patch("bom_bench.sca_tools.get_registered_tools")
+    @patch("bom_bench.fixtures.loader.FixtureSetLoader")
+    @patch("bom_bench.runner.BenchmarkRunner")
+    def test_benchmark_jobs_option(
+        self, mock_runner_class, mock_loader_class, mock_get_tools, mock_init
+    ):
+        """Test --jobs sets the number of concurrent fixture runs."""
+        mock_get_tools.return_value = {"cdxgen": MagicMock()}
+
+        mock_fs = MagicMock()
+        mock_fs.name = "test-set"
+        mock_fs.fixtures = [MagicMock()]
+
+        mock_loader = MagicMock()
+        mock_loader.load_all.return_value = [mock_fs]
+        mock_loader_class.return_value = mock_loader
+
+        mock_runner = MagicMock()
+        mock_runner.run.return_value = []
+        mock_runner_class.return_value = mock_runner
+
+        result = runner.invoke(app, ["benchmark", "--jobs", "4"])
+
+        assert result.exit_code == 0
+        assert mock_runner_class.call_args.kwargs["max_workers"] == 4
+
     @patch("bom_bench.plugins.initialize_plugins")
     @patch("bom_bench.sca_tools.get_registered_tools")
     @patch("bom_bench.fixtures.loader.FixtureSetLoader")
@@ -451,6 +478,17 @@ class TestHelperFunctions:
         result = _validate_tool_selection(["cdxgen"], registered)
         assert result == ["cdxgen"]
 
+    def test_validate_tool_selection_interns_requested_tools(self):
+        """Test requested tool names parsed at runtime are interned."""
+        import sys
+
+        registered = {"cli-interned-tool": MagicMock()}
+        requested = "".join(["cli-interned", "-tool"])
+
+        result = _validate_tool_selection([requested], registered)
+
+        assert result[0] is sys.intern("cli-interned-tool")
+
     def test_validate_tool_selection_invalid_tool(self):
         """Test tool validation raises error for invalid tool."""
         import pytest
@@ -1,7 +1,16 @@
+import os
+import subprocess
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-from bom_bench.sandbox.mise import MiseRunner, ToolSpec, generate_mise_toml
+from bom_bench.sandbox.mise import (
+    MiseRunner,
+    MiseRunResult,
+    ToolSpec,
+    _find_mise,
+    _render_tools_and_env,
+    generate_mise_toml,
+)
 
 
 class TestToolSpec:
@@ -75,22 +84,72 @@ class TestGenerateMiseToml:
         assert "[env]" in result
         assert "[tasks.sca]" in result
 
+    def test_generate_full_config_layout(self):
+        tools = [ToolSpec(name="uv", version="0.5.11")]
+        env = {"UV_INDEX_URL": "http://localhost:3141/simple"}
+
+        result = generate_mise_toml(tools=tools, env=env, task_name="sca", task_command="cdxgen")
+
+        assert result == (
+            '[tools]\nuv = "0.5.11"\n\n'
+            '[env]\nUV_INDEX_URL = "http://localhost:3141/simple"\n\n'
+            '[tasks.sca]\nrun = "cdxgen"\n'
+        )
+
+    def test_generate_reuses_tools_and_env_for_new_task_commands(self):
+        tools = [ToolSpec(name="node", version="22")]
+        env = {"CI": "true"}
+        _render_tools_and_env.cache_clear()
+
+        first = generate_mise_toml(tools, env, task_name="sca", task_command="cdxgen a")
+        second = generate_mise_toml(tools, env, task_name="sca", task_command="cdxgen b")
+
+        assert _render_tools_and_env.cache_info().hits == 1
+        assert 'run = "cdxgen a"' in first
+        assert 'run = "cdxgen b"' in second
+
+
+class TestMiseRunResult:
+    def test_failed(self):
+        result = MiseRunResult.failed("boom", duration_seconds=1.5)
+
+        assert not result.success
+        assert result.exit_code is None
+        assert result.stdout == ""
+        assert result.stderr == ""
+        assert result.duration_seconds == 1.5
+        assert result.error_message == "boom"
+
+    def test_failed_defaults_to_zero_duration(self):
+        assert MiseRunResult.failed("boom").duration_seconds == 0.0
+
 
 class TestMiseRunner:
     def test_create_runner(self, tmp_path: Path):
         runner = MiseRunner(cwd=tmp_path)
         assert runner.cwd == tmp_path
 
-    def test_run_task_mise_not_found(self, tmp_path: Path, monkeypatch):
+    def test_run_task_mise_not_found(self, tmp_path: Path):
         runner = MiseRunner(cwd=tmp_path)
-        monkeypatch.setattr("shutil.which", lambda x: None)
 
-        result = runner.run_task("sca", timeout=10)
+        with patch("bom_bench.sandbox.mise._find_mise", return_value=None):
+            result = runner.run_task("sca", timeout=10)
 
         assert not result.success
         assert result.error_message is not None
         assert "mise" in result.error_message.lower()
 
+    def test_find_mise_probes_path_once(self):
+        _find_mise.cache_clear()
+        try:
+            with patch("bom_bench.sandbox.mise.shutil.which", return_value=None) as mock_which:
+                _find_mise()
+                _find_mise()
+
+            mock_which.assert_called_once_with("mise")
+        finally:
+            _find_mise.cache_clear()
+
     def test_run_task_returns_result(self, tmp_path: Path):
         runner = MiseRunner(cwd=tmp_path)
 
@@ -108,17 +167,6 @@ class TestMiseRunner:
         assert hasattr(result, "duration_seconds")
         assert hasattr(result, "error_message")
 
-    def test_trust_mise_toml(self, tmp_path: Path):
-        runner = MiseRunner(cwd=tmp_path)
-
-        # Create a mise.toml
-        mise_toml = tmp_path / "mise.toml"
-        mise_toml.write_text('[tools]\npython = "3.12"\n')
-
-        # trust() should return bool
-        result = runner.trust()
-        assert isinstance(result, bool)
-
     def test_write_mise_toml(self, tmp_path: Path):
         runner = MiseRunner(cwd=tmp_path)
         tools = [ToolSpec(name="python", version="3.12")]
@@ -149,19 +197,74 @@ class TestMiseRunner:
             assert "MISE_CEILING_PATHS" in call_kwargs["env"]
             assert call_kwargs["env"]["MISE_CEILING_PATHS"] == str(tmp_path)
 
-    def test_trust_sets_mise_ceiling_paths(self, tmp_path: Path):
-        """Verify MISE_CEILING_PATHS is set during trust operation."""
-        runner = MiseRunner(cwd=tmp_path)
+    def test_run_task_trusts_sandbox_config(self, tmp_path: Path):
+        """Verify run_task trusts the resolved sandbox mise.toml without a separate trust call."""
+        real = tmp_path / "real"
+        real.mkdir()
+        link = tmp_path / "link"
+        link.symlink_to(real)
+        runner = MiseRunner(cwd=link)
 
-        with patch("bom_bench.sandbox.mise.subprocess.run") as mock_run:
-            mock_result = MagicMock()
-            mock_result.returncode = 0
-            mock_run.return_value = mock_result
+        with (
+            patch("bom_bench.sandbox.mise._find_mise", return_value="/usr/bin/mise"),
+            patch("bom_bench.sandbox.mise.subprocess.run") as mock_run,
+        ):
+            mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
 
-            runner.trust()
+            runner.run_task("test")
 
             mock_run.assert_called_once()
-            call_kwargs = mock_run.call_args.kwargs
-            assert "env" in call_kwargs
-            assert "MISE_CEILING_PATHS" in call_kwargs["env"]
-            assert call_kwargs["env"]["MISE_CEILING_PATHS"] == str(tmp_path)
+            assert mock_run.call_args.kwargs["env"]["MISE_TRUSTED_CONFIG_PATHS"] == str(
+                real.resolve() / "mise.toml"
+            )
+
+    def test_run_task_appends_to_existing_trusted_config_paths(self, tmp_path: Path):
+        """Verify run_task keeps trusted config paths the user already set."""
+        runner = MiseRunner(cwd=tmp_path)
+
+        with (
+            patch.dict(os.environ, {"MISE_TRUSTED_CONFIG_PATHS": "/home/user/project"}),
+            patch("bom_bench.sandbox.mise._find_mise", return_value="/usr/bin/mise"),
+            patch("bom_bench.sandbox.mise.subprocess.run") as mock_run,
+        ):
+            mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+
+            runner.run_task("test")
+
+            env = mock_run.call_args.kwargs["env"]
+            assert env["MISE_TRUSTED_CONFIG_PATHS"] == os.pathsep.join(
+                ["/home/user/project", str(tmp_path.resolve() / "mise.toml")]
+            )
+
+    def test_run_task_timeout(self, tmp_path: Path):
+        """Verify a timed-out task reports failure with a monotonic duration."""
+        runner = MiseRunner(cwd=tmp_path)
+
+        with (
+            patch("bom_bench.sandbox.mise._find_mise", return_value="/usr/bin/mise"),
+            patch(
+                "bom_bench.sandbox.mise.subprocess.run",
+                side_effect=subprocess.TimeoutExpired(cmd="mise", timeout=5),
+            ),
+        ):
+            result = runner.run_task("sca", timeout=5)
+
+        assert not result.success
+        assert result.exit_code is None
+        assert result.error_message == "Timeout after 5 seconds"
+        assert result.duration_seconds >= 0
+
+    def test_run_task_uses_resolved_mise_path(self, tmp_path: Path):
+        """Verify the task runs the mise binary found on PATH by absolute path."""
+        runner = MiseRunner(cwd=tmp_path)
+
+        with (
+            patch("bom_bench.sandbox.mise._find_mise", return_value="/usr/bin/mise"),
+            patch("bom_bench.sandbox.mise.subprocess.run") as mock_run,
+        ):
+            mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+
+            result = runner.run_task("sca")
+
+        assert result.success
+        assert mock_run.call_args.args[0] == ["/usr/bin/mise", "run", "sca"]
@@ -1,15 +1,24 @@
 """Tests for plugin system."""
 
+import sys
+import threading
+from collections.abc import Mapping
+from unittest.mock import MagicMock, patch
+
+import pytest
+
 from bom_bench.models.sca_tool import SCAToolInfo
 from bom_bench.plugins import (
     get_plugins,
     initialize_plugins,
+    pm,
     reset_plugins,
 )
 from bom_bench.sca_tools import (
     get_registered_tools,
     get_tool_info,
     get_tool_plugin,
+    get_tool_response_handler,
 )
 
 
@@ -37,6 +46,24 @@ class TestPluginInitialization:
 
         assert tools1 == tools2
 
+    def test_initialize_plugins_concurrent_calls_load_once(self):
+        """Test that concurrent initialization only loads plugins once."""
+        barrier = threading.Barrier(4)
+
+        def initialize():
+            barrier.wait()
+            initialize_plugins()
+
+        with patch("bom_bench.plugins._load_default_plugins") as mock_load:
+            threads = [threading.Thread(target=initialize) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        mock_load.assert_called_once()
+        reset_plugins()
+
     def test_reset_plugins(self):
         """Test plugin reset."""
         initialize_plugins()
@@ -47,6 +74,46 @@ class TestPluginInitialization:
         tools = get_registered_tools()
         assert "cdxgen" in tools
 
+    def test_reset_plugins_unregisters_loaded_plugins(self):
+        """Test reset unregisters the plugins loaded during initialization."""
+        initialize_plugins()
+        assert pm.has_plugin("bom_bench.sca_tools.cdxgen")
+
+        reset_plugins()
+
+        assert not pm.has_plugin("bom_bench.sca_tools.cdxgen")
+
+    def test_reset_plugins_unregisters_entry_point_plugins(self):
+        """Test reset unregisters plugins loaded via setuptools entry points."""
+        plugin = object()
+
+        def load_entrypoints(group):
+            pm.register(plugin, name="test_entry_point_plugin")
+            return 1
+
+        with (
+            patch.object(pm, "load_setuptools_entrypoints", side_effect=load_entrypoints),
+            patch.object(pm, "list_plugin_distinfo", return_value=[(plugin, MagicMock())]),
+        ):
+            initialize_plugins()
+
+        assert pm.is_registered(plugin)
+
+        reset_plugins()
+
+        assert not pm.is_registered(plugin)
+
+    def test_reset_plugins_keeps_externally_registered_plugins(self):
+        """Test reset leaves plugins registered directly on pm alone."""
+        plugin = object()
+        pm.register(plugin, name="test_external_plugin")
+        try:
+            reset_plugins()
+
+            assert pm.is_registered(plugin)
+        finally:
+            pm.unregister(plugin)
+
 
 class TestToolRegistry:
     """Tests for tool registry functions."""
@@ -60,10 +127,44 @@ class TestToolRegistry:
         """Test getting registered tools."""
         tools = get_registered_tools()
 
-        assert isinstance(tools, dict)
+        assert isinstance(tools, Mapping)
         assert "cdxgen" in tools
         assert isinstance(tools["cdxgen"], SCAToolInfo)
 
+    def test_get_registered_tools_is_read_only(self):
+        """Test registered tools are returned as a read-only view."""
+        tools = get_registered_tools()
+
+        with pytest.raises(TypeError):
+            tools["new-tool"] = tools["cdxgen"]  # type: ignore[index]
+
+    def test_get_registered_tools_returns_same_view(self):
+        """Test repeated calls reuse the view instead of copying."""
+        assert get_registered_tools() is get_registered_tools()
+
+    def test_registered_tool_names_are_interned(self):
+        """Test tool names built at runtime are interned so lookups can match on identity."""
+        import bom_bench.sca_tools as sca_tools
+        from bom_bench import hookimpl
+
+        runtime_name = "".join(["runtime-interned", "-tool"])
+
+        class RuntimeNamePlugin:
+            @hookimpl
+            def register_sca_tools(self):
+                return {"name": runtime_name, "description": "Runtime name", "command": "true"}
+
+        plugin = RuntimeNamePlugin()
+        pm.register(plugin, name="test_runtime_name_plugin")
+        try:
+            sca_tools._register_tools(pm)
+
+            name = next(name for name in get_registered_tools() if name == runtime_name)
+            assert name is sys.intern("runtime-interned-tool")
+        finally:
+            pm.unregister(plugin)
+            reset_plugins()
+
     def test_get_tool_info_exists(self):
         """Test getting info for existing tool."""
         info = get_tool_info("cdxgen")
@@ -92,6 +193,26 @@ class TestToolRegistry:
 
         assert plugin is None
 
+    def test_get_tool_response_handler_exists(self):
+        """Test handler is resolved for a tool whose plugin implements the hook."""
+        from bom_bench.sca_tools import snyk
+
+        handler = get_tool_response_handler("snyk")
+
+        assert handler is snyk.handle_sca_tool_response
+
+    def test_get_tool_response_handler_plugin_without_hook(self):
+        """Test no handler for a tool whose plugin lacks the hook."""
+        handler = get_tool_response_handler("cdxgen")
+
+        assert handler is None
+
+    def test_get_tool_response_handler_not_exists(self):
+        """Test no handler for a non-existent tool."""
+        handler = get_tool_response_handler("nonexistent")
+
+        assert handler is None
+
     def test_get_tool_plugin_after_reset(self):
         """Test plugin mapping survives reset and re-initialization."""
         # Get plugin before reset
@@ -107,6 +228,42 @@ class TestToolRegistry:
         assert plugin2 is not None
         assert plugin2 == plugin1
 
+    def test_registered_tools_follow_hook_execution_order(self):
+        """Test tools are registered in hook execution order, which is the default run order."""
+        bundled = {"cdxgen", "syft", "snyk"}
+
+        names = [name for name in get_registered_tools() if name in bundled]
+
+        assert names == ["snyk", "syft", "cdxgen"]
+
+    def test_duplicate_tool_name_keeps_first_registration(self):
+        """Test a later plugin reusing a tool name is skipped, not re-parsed."""
+        import bom_bench.sca_tools as sca_tools
+        from bom_bench import hookimpl
+        from bom_bench.sca_tools import cdxgen
+
+        class DuplicatePlugin:
+            @hookimpl
+            def register_sca_tools(self):
+                return {"name": "cdxgen", "description": "Duplicate", "command": "true"}
+
+        plugin = DuplicatePlugin()
+        pm.register(plugin, name="test_duplicate_plugin")
+        try:
+            with patch.object(
+                SCAToolInfo, "from_dict", wraps=SCAToolInfo.from_dict
+            ) as mock_from_dict:
+                sca_tools._register_tools(pm)
+
+            assert mock_from_dict.call_count == len(get_registered_tools())
+            assert get_tool_plugin("cdxgen") is cdxgen
+            tool_info = get_tool_info("cdxgen")
+            assert tool_info is not None
+            assert tool_info.description != "Duplicate"
+        finally:
+            pm.unregister(plugin)
+            reset_plugins()
+
 
 class TestPluginInfo:
     """Tests for plugin information."""
@@ -126,11 +283,29 @@ class TestPluginInfo:
         # Find cdxgen plugin
         cdxgen_plugin = None
         for p in plugins:
-            if "cdxgen" in p.get("name", ""):
+            if "cdxgen" in p.name:
                 cdxgen_plugin = p
                 break
 
         assert cdxgen_plugin is not None
+        assert cdxgen_plugin.module == "bom_bench.sca_tools.cdxgen"
+
+    def test_get_plugins_uses_snapshot_from_initialization(self):
+        """Test plugin info is built at initialization, not on every call."""
+        with patch.object(pm, "get_plugins") as mock_get_plugins:
+            plugins = get_plugins()
+
+        mock_get_plugins.assert_not_called()
+        assert any(p.name == "bom_bench.sca_tools.cdxgen" for p in plugins)
+
+    def test_get_plugins_reflects_reset(self):
+        """Test the plugin info snapshot is rebuilt after reset."""
+        plugins_before = get_plugins()
+
+        reset_plugins()
+
+        assert get_plugins() == plugins_before
+        assert get_plugins() is not get_plugins()
 
 
 class TestCdxgenPlugin:
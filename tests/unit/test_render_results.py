@@ -2,7 +2,7 @@
 
 from unittest.mock import patch
 
-from bom_bench.models.sca_tool import BenchmarkSummary
+from bom_bench.models.sca_tool import BenchmarkOverallSummary, BenchmarkSummary
 from bom_bench.renderers import render_results
 
 
@@ -80,12 +80,14 @@ class TestRenderResults:
             assert files[0].name == "test.json"
 
     def test_render_results_creates_tool_directories(self, tmp_path):
-        """Test that tool directories are created."""
+        """Test that tool directories are created for rendered output."""
         summary1 = BenchmarkSummary(package_manager="packse", tool_name="cdxgen")
         summary2 = BenchmarkSummary(package_manager="packse", tool_name="syft")
 
         with patch("bom_bench.renderers.pm") as mock_pm:
-            mock_pm.hook.register_sca_tool_result_renderer.return_value = []
+            mock_pm.hook.register_sca_tool_result_renderer.return_value = [
+                {"filename": "results.json", "content": "{}"}
+            ]
             mock_pm.hook.register_benchmark_result_renderer.return_value = []
 
             render_results([summary1, summary2], tmp_path)
@@ -95,6 +97,32 @@ class TestRenderResults:
             assert (tmp_path / "syft").exists()
             assert (tmp_path / "syft").is_dir()
 
+    def test_render_results_skips_tool_directory_without_output(self, tmp_path):
+        """Test that no tool directory is created when no renderer produces output."""
+        summary = BenchmarkSummary(package_manager="packse", tool_name="cdxgen")
+
+        with patch("bom_bench.renderers.pm") as mock_pm:
+            mock_pm.hook.register_sca_tool_result_renderer.return_value = [None]
+            mock_pm.hook.register_benchmark_result_renderer.return_value = []
+
+            render_results([summary], tmp_path)
+
+            assert not (tmp_path / "cdxgen").exists()
+
+    def test_render_results_writes_utf8(self, tmp_path):
+        """Test that rendered content is written as UTF-8."""
+        summary = BenchmarkSummary(package_manager="packse", tool_name="cdxgen")
+
+        with patch("bom_bench.renderers.pm") as mock_pm:
+            mock_pm.hook.register_sca_tool_result_renderer.return_value = []
+            mock_pm.hook.register_benchmark_result_renderer.return_value = [
+                {"filename": "summary.txt", "content": "précision ✓"}
+            ]
+
+            render_results([summary], tmp_path)
+
+            assert (tmp_path / "summary.txt").read_bytes() == "précision ✓".encode()
+
     def test_render_results_passes_summary_dicts(self, tmp_path):
         """Test that summaries are converted to dicts before passing to hooks."""
         summary = BenchmarkSummary(package_manager="packse", tool_name="cdxgen")
@@ -125,3 +153,103 @@ class TestRenderResults:
             assert isinstance(call_kwargs["summaries"], list)
             assert isinstance(call_kwargs["summaries"][0], dict)
             assert call_kwargs["summaries"][0]["successful"] == 5
+
+    def test_render_results_skips_hooks_without_implementations(self, tmp_path):
+        """Test that renderer hooks are not called when no plugin implements them."""
+        summary = BenchmarkSummary(package_manager="packse", tool_name="cdxgen")
+
+        with (
+            patch("bom_bench.renderers.pm") as mock_pm,
+            patch.object(BenchmarkSummary, "to_dict") as mock_to_dict,
+        ):
+            mock_pm.hook.register_sca_tool_result_renderer.get_hookimpls.return_value = []
+            mock_pm.hook.register_benchmark_result_renderer.get_hookimpls.return_value = []
+
+            render_results([summary], tmp_path)
+
+            mock_pm.hook.register_sca_tool_result_renderer.assert_not_called()
+            mock_pm.hook.register_benchmark_result_renderer.assert_not_called()
+            mock_to_dict.assert_not_called()
+            assert not (tmp_path / "cdxgen").exists()
+
+    def test_render_results_only_tool_renderers(self, tmp_path):
+        """Test that benchmark-level work is skipped when only tool-level renderers exist."""
+        summary = BenchmarkSummary(package_manager="packse", tool_name="cdxgen")
+
+        with (
+            patch("bom_bench.renderers.pm") as mock_pm,
+            patch.object(BenchmarkOverallSummary, "from_summaries") as mock_from_summaries,
+        ):
+            mock_pm.hook.register_benchmark_result_renderer.get_hookimpls.return_value = []
+            mock_pm.hook.register_sca_tool_result_renderer.return_value = [
+                {"filename": "results.json", "content": "{}"}
+            ]
+
+            render_results([summary], tmp_path)
+
+            assert (tmp_path / "cdxgen" / "results.json").read_text() == "{}"
+            mock_from_summaries.assert_not_called()
+            mock_pm.hook.register_benchmark_result_renderer.assert_not_called()
+
+    def test_render_results_creates_output_dir_for_benchmark_results(self, tmp_path):
+        """Test that a missing output_dir is created when only benchmark renderers write."""
+        summary = BenchmarkSummary(package_manager="packse", tool_name="cdxgen")
+        output_dir = tmp_path / "out"
+
+        with patch("bom_bench.renderers.pm") as mock_pm:
+            mock_pm.hook.register_sca_tool_result_renderer.return_value = [None]
+            mock_pm.hook.register_benchmark_result_renderer.return_value = [
+                {"filename": "b.csv", "content": "x"}
+            ]
+
+            render_results([summary], output_dir)
+
+            assert (output_dir / "b.csv").read_text() == "x"
+
+    def test_render_results_creates_output_dir_without_tool_renderers(self, tmp_path):
+        """Test that a missing output_dir is created when no tool-level hookimpl exists."""
+        summary = BenchmarkSummary(package_manager="packse", tool_name="cdxgen")
+        output_dir = tmp_path / "out"
+
+        with patch("bom_bench.renderers.pm") as mock_pm:
+            mock_pm.hook.register_sca_tool_result_renderer.get_hookimpls.return_value = []
+            mock_pm.hook.register_benchmark_result_renderer.return_value = [
+                {"filename": "b.csv", "content": "x"}
+            ]
+
+            render_results([summary], output_dir)
+
+            assert (output_dir / "b.csv").read_text() == "x"
+            assert not (output_dir / "cdxgen").exists()
+
+    def test_render_results_converts_each_summary_once(self, tmp_path):
+        """Test that each summary is converted to a dict once for both renderer hooks."""
+        summary1 = BenchmarkSummary(package_manager="packse", tool_name="cdxgen")
+        summary2 = BenchmarkSummary(package_manager="packse", tool_name="syft")
+
+        with (
+            patch("bom_bench.renderers.pm") as mock_pm,
+            patch.object(
+                BenchmarkSummary, "to_dict", autospec=True, side_effect=lambda s: {}
+            ) as mock_to_dict,
+        ):
+            mock_pm.hook.register_sca_tool_result_renderer.return_value = []
+            mock_pm.hook.register_benchmark_result_renderer.return_value = []
+
+            render_results([summary1, summary2], tmp_path)
+
+            assert mock_to_dict.call_count == 2
+
+    def test_render_results_writes_bytes_content(self, tmp_path):
+        """Test that renderers may return already-encoded bytes content."""
+        summary = BenchmarkSummary(package_manager="packse", tool_name="cdxgen")
+
+        with patch("bom_bench.renderers.pm") as mock_pm:
+            mock_pm.hook.register_sca_tool_result_renderer.return_value = [
+                {"filename": "results.json", "content": b'{"test": "data"}'}
+            ]
+            mock_pm.hook.register_benchmark_result_renderer.return_value = []
+
+            render_results([summary], tmp_path)
+
+            assert (tmp_path / "cdxgen" / "results.json").read_bytes() == b'{"test": "data"}'
@@ -128,6 +128,63 @@ class TestFixtureExecutor:
             assert result.metrics.precision == 1.0
             assert result.metrics.recall == 1.0
 
+    def test_execute_loads_expected_sbom_once_per_fixture(
+        self, sample_fixture, sample_fixture_set, sample_tool_config, tmp_path: Path
+    ):
+        from bom_bench.benchmarking.comparison import load_expected_sbom
+        from bom_bench.runner.executor import FixtureExecutor
+
+        actual_path = tmp_path / "actual.cdx.json"
+        actual_path.write_text(json.dumps({"components": [{"purl": "pkg:pypi/requests@2.31.0"}]}))
+        mock_result = SandboxResult(
+            fixture_name="test-fixture",
+            tool_name="test-tool",
+            success=True,
+            actual_sbom_path=actual_path,
+        )
+
+        with (
+            patch("bom_bench.runner.executor.Sandbox") as mock_sandbox_cls,
+            patch(
+                "bom_bench.runner.executor.load_expected_sbom", wraps=load_expected_sbom
+            ) as mock_load_expected,
+        ):
+            mock_sandbox_cls.return_value.__enter__.return_value.run.return_value = mock_result
+
+            executor = FixtureExecutor()
+            results = [
+                executor.execute(
+                    fixture=sample_fixture,
+                    fixture_set_env=sample_fixture_set.environment,
+                    tool_config=sample_tool_config,
+                    fixture_set_name="test-set",
+                    output_dir=tmp_path,
+                )
+                for _ in range(2)
+            ]
+
+        mock_load_expected.assert_called_once()
+        assert all(r.metrics is not None and r.metrics.recall == 1.0 for r in results)
+        # The cached PURLs are shared between results, so they must be immutable
+        assert all(isinstance(r.metrics.expected_purls, frozenset) for r in results)
+
+    def test_expected_purls_cache_is_keyed_on_meta_path(self, sample_fixture, tmp_path: Path):
+        from bom_bench.runner.executor import FixtureExecutor
+
+        unsatisfiable_meta = tmp_path / "unsatisfiable-meta.json"
+        unsatisfiable_meta.write_text('{"satisfiable": false}')
+
+        executor = FixtureExecutor()
+        expected_sbom = sample_fixture.files.expected_sbom
+
+        satisfiable = executor._load_expected_purls(
+            expected_sbom, meta_path=sample_fixture.files.meta
+        )
+        unsatisfiable = executor._load_expected_purls(expected_sbom, meta_path=unsatisfiable_meta)
+
+        assert satisfiable == (frozenset({"pkg:pypi/requests@2.31.0"}), True)
+        assert unsatisfiable == (None, False)
+
     def test_execute_fixture_unsatisfiable(
         self, sample_fixture_set, sample_tool_config, tmp_path: Path
     ):
@@ -169,6 +226,24 @@ class TestBenchmarkRunner:
         runner = BenchmarkRunner(output_dir=tmp_path)
         assert runner.output_dir == tmp_path
 
+    def test_runner_rejects_workers_with_fixed_temp_dir(self, tmp_path: Path):
+        from bom_bench.models.sandbox import SandboxConfig
+        from bom_bench.runner import BenchmarkRunner
+
+        config = SandboxConfig(temp_dir=tmp_path / "sandbox")
+
+        with pytest.raises(ValueError, match="temp_dir"):
+            BenchmarkRunner(output_dir=tmp_path, sandbox_config=config, max_workers=2)
+
+    def test_runner_allows_fixed_temp_dir_when_serial(self, tmp_path: Path):
+        from bom_bench.models.sandbox import SandboxConfig
+        from bom_bench.runner import BenchmarkRunner
+
+        config = SandboxConfig(temp_dir=tmp_path / "sandbox")
+
+        runner = BenchmarkRunner(output_dir=tmp_path, sandbox_config=config)
+        assert runner.max_workers == 1
+
     def test_runner_run_empty_fixtures(self, tmp_path: Path):
         from bom_bench.runner import BenchmarkRunner
 
@@ -181,3 +256,53 @@ class TestBenchmarkRunner:
             results = runner.run(tools=["cdxgen"])
 
             assert results == []
+
+    def test_runner_defaults_to_serial_execution(self, tmp_path: Path):
+        from bom_bench.runner import BenchmarkRunner
+
+        runner = BenchmarkRunner(output_dir=tmp_path)
+        assert runner.max_workers == 1
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_runner_run_keeps_fixture_order(self, tmp_path: Path, max_workers: int):
+        """Test results are added in fixture order regardless of worker count."""
+        import time
+
+        from bom_bench.models.sca_tool import BenchmarkResult, BenchmarkStatus
+        from bom_bench.runner import BenchmarkRunner
+
+        fixtures = []
+        for i in range(6):
+            fixture = MagicMock()
+            fixture.name = f"fixture-{i}"
+            fixtures.append(fixture)
+
+        fixture_set = MagicMock()
+        fixture_set.name = "test-set"
+        fixture_set.fixtures = fixtures
+
+        def execute(fixture, **kwargs):
+            # Later fixtures finish first when run concurrently
+            time.sleep(0.01 * (len(fixtures) - fixtures.index(fixture)))
+            return BenchmarkResult(
+                status=BenchmarkStatus.UNSATISFIABLE,
+                scenario_name=fixture.name,
+                package_manager="fixture",
+                tool_name="test-tool",
+            )
+
+        callback = MagicMock()
+        with (
+            patch("bom_bench.runner.runner.FixtureSetLoader") as mock_loader_cls,
+            patch("bom_bench.runner.runner.get_tool_config", return_value=MagicMock()),
+            patch("bom_bench.runner.runner.render_results"),
+        ):
+            mock_loader_cls.return_value.load_all.return_value = [fixture_set]
+
+            runner = BenchmarkRunner(output_dir=tmp_path, max_workers=max_workers)
+            with patch.object(runner.executor, "execute", side_effect=execute):
+                summaries = runner.run(tools=["test-tool"], progress_callback=callback)
+
+        expected = [f.name for f in fixtures]
+        assert [r.scenario_name for r in summaries[0].results] == expected
+        assert [c.args[2] for c in callback.call_args_list] == expected
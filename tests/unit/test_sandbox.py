@@ -135,6 +135,15 @@ class TestSandbox:
             assert (project_dir / "pyproject.toml").exists()
             assert (project_dir / "uv.lock").exists()
 
+    def test_sandbox_copies_nested_fixture_directories(self, fixture, fixture_env, sca_tool):
+        nested = fixture.project_dir / "packages" / "lib"
+        nested.mkdir(parents=True)
+        (nested / "pyproject.toml").write_text('[project]\nname = "lib"\n')
+
+        with Sandbox(fixture, fixture_env, sca_tool) as sandbox:
+            copied = sandbox.project_dir / "packages" / "lib" / "pyproject.toml"
+            assert copied.read_text() == '[project]\nname = "lib"\n'
+
     def test_sandbox_generates_mise_toml(self, fixture, fixture_env, sca_tool):
         with Sandbox(fixture, fixture_env, sca_tool) as sandbox:
             mise_toml = sandbox.sandbox_dir / "mise.toml"
@@ -176,6 +185,48 @@ class TestSandbox:
             assert result.fixture_name == "test-fixture"
             assert result.tool_name == "cdxgen"
 
+    def test_execute_sca_tool_without_output_file(self, fixture, fixture_env, sca_tool):
+        """Test a successful run that writes no SBOM is reported as failed."""
+        mise_result = MiseRunResult(
+            success=True, exit_code=0, stdout="", stderr="", duration_seconds=1.0
+        )
+
+        with (
+            Sandbox(fixture, fixture_env, sca_tool) as sandbox,
+            patch("bom_bench.sandbox.sandbox.MiseRunner") as mock_runner_cls,
+            patch.object(sandbox, "_handle_tool_response"),
+        ):
+            mock_runner_cls.return_value.run_task.return_value = mise_result
+
+            result = sandbox.run()
+
+        assert result.success is False
+        assert result.actual_sbom_path is None
+
+    def test_execute_sca_tool_copies_sbom_to_output_dir(
+        self, fixture, fixture_env, sca_tool, tmp_path: Path
+    ):
+        """Test the SBOM is copied to the configured output directory."""
+        mise_result = MiseRunResult(
+            success=True, exit_code=0, stdout="", stderr="", duration_seconds=1.0
+        )
+        output_dir = tmp_path / "output"
+        config = SandboxConfig(output_dir=output_dir)
+
+        with (
+            Sandbox(fixture, fixture_env, sca_tool, config) as sandbox,
+            patch("bom_bench.sandbox.sandbox.MiseRunner") as mock_runner_cls,
+            patch.object(sandbox, "_handle_tool_response"),
+        ):
+            mock_runner_cls.return_value.run_task.return_value = mise_result
+            sandbox.output_path.write_text('{"bomFormat": "CycloneDX"}')
+
+            result = sandbox.run()
+
+        assert result.success is True
+        assert result.actual_sbom_path == output_dir / "actual.cdx.json"
+        assert result.actual_sbom_path.read_text() == '{"bomFormat": "CycloneDX"}'
+
     def test_sandbox_output_path(self, fixture, fixture_env, sca_tool):
         with Sandbox(fixture, fixture_env, sca_tool) as sandbox:
             assert sandbox.output_path == sandbox.sandbox_dir / "actual.cdx.json"
@@ -272,8 +323,11 @@ class TestSandboxHookInvocation:
 
             mock_plugin = MockPlugin()
 
-            # Mock get_tool_plugin to return our mock
-            with patch("bom_bench.sca_tools.get_tool_plugin", return_value=mock_plugin):
+            # Mock get_tool_response_handler to return our mock's hook
+            with patch(
+                "bom_bench.sca_tools.get_tool_response_handler",
+                return_value=mock_plugin.handle_sca_tool_response,
+            ):
                 mise_result = MiseRunResult(
                     success=True,
                     exit_code=0,
@@ -304,7 +358,10 @@ class TestSandboxHookInvocation:
             # Pre-create output file
             sandbox.output_path.write_text("original content")
 
-            with patch("bom_bench.sca_tools.get_tool_plugin", return_value=mock_plugin):
+            with patch(
+                "bom_bench.sca_tools.get_tool_response_handler",
+                return_value=mock_plugin.handle_sca_tool_response,
+            ):
                 mise_result = MiseRunResult(
                     success=True,
                     exit_code=0,
@@ -318,6 +375,37 @@ class TestSandboxHookInvocation:
                 # Original content should be unchanged
                 assert sandbox.output_path.read_text() == "original content"
 
+    def test_handle_tool_response_skips_unchanged_output(self, fixture, fixture_env, sca_tool):
+        """Test _handle_tool_response does not rewrite output the hook returned unchanged."""
+        with Sandbox(fixture, fixture_env, sca_tool) as sandbox:
+
+            class MockPlugin:
+                def handle_sca_tool_response(self, bom_bench, stdout, stderr, output_file_contents):
+                    return output_file_contents
+
+            mock_plugin = MockPlugin()
+
+            sandbox.output_path.write_text("original content")
+
+            with (
+                patch(
+                    "bom_bench.sca_tools.get_tool_response_handler",
+                    return_value=mock_plugin.handle_sca_tool_response,
+                ),
+                patch.object(Path, "write_text") as mock_write_text,
+            ):
+                mise_result = MiseRunResult(
+                    success=True,
+                    exit_code=0,
+                    stdout="output",
+                    stderr="",
+                    duration_seconds=1.0,
+                )
+
+                sandbox._handle_tool_response(mise_result)
+
+                mock_write_text.assert_not_called()
+
     def test_handle_tool_response_receives_correct_args(self, fixture, fixture_env, sca_tool):
         """Test _handle_tool_response passes correct arguments to hook."""
         with Sandbox(fixture, fixture_env, sca_tool) as sandbox:
@@ -336,7 +424,10 @@ class TestSandboxHookInvocation:
 
             mock_plugin = MockPlugin()
 
-            with patch("bom_bench.sca_tools.get_tool_plugin", return_value=mock_plugin):
+            with patch(
+                "bom_bench.sca_tools.get_tool_response_handler",
+                return_value=mock_plugin.handle_sca_tool_response,
+            ):
                 mise_result = MiseRunResult(
                     success=True,
                     exit_code=0,
@@ -367,7 +458,10 @@ class TestSandboxHookInvocation:
             # Pre-create output file
             sandbox.output_path.write_text("original content")
 
-            with patch("bom_bench.sca_tools.get_tool_plugin", return_value=mock_plugin):
+            with patch(
+                "bom_bench.sca_tools.get_tool_response_handler",
+                return_value=mock_plugin.handle_sca_tool_response,
+            ):
                 mise_result = MiseRunResult(
                     success=True,
                     exit_code=0,
@@ -397,7 +491,10 @@ class TestSandboxHookInvocation:
         with (
             Sandbox(fixture, fixture_env, sca_tool) as sandbox,
             patch.object(sandbox, "_execute_sca_tool") as mock_execute,
-            patch("bom_bench.sca_tools.get_tool_plugin", return_value=mock_plugin),
+            patch(
+                "bom_bench.sca_tools.get_tool_response_handler",
+                return_value=mock_plugin.handle_sca_tool_response,
+            ),
         ):
             # Mock a failed tool execution
             mock_execute.return_value = SandboxResult(
@@ -197,6 +197,13 @@ class TestBenchmarkResult:
         assert result.metrics is None
 
 
+@pytest.mark.parametrize("model", [SCAToolInfo, PurlMetrics, BenchmarkResult])
+def test_per_scenario_models_use_slots(model):
+    """Models created per tool or scenario are slotted to avoid a per-instance dict."""
+    assert "__slots__" in vars(model)
+    assert "__dict__" not in vars(model)
+
+
 class TestBenchmarkSummary:
     """Tests for BenchmarkSummary model."""
 